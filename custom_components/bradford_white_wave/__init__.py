@@ -4,12 +4,24 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Any
 
 from bradford_white_wave_client import BradfordWhiteClient
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from .const import DOMAIN
+from .cassette import RecordingClient, ReplayClient
+from .const import (
+    CASSETTE_MODE_OFF,
+    CASSETTE_MODE_RECORD,
+    CASSETTE_MODE_REPLAY,
+    CONF_CASSETTE_MODE,
+    CONF_CASSETTE_PATH,
+    CONF_REPLAY_SPEED,
+    DEFAULT_CASSETTE_PATH,
+    DEFAULT_REPLAY_SPEED,
+    DOMAIN,
+)
 from .coordinator import (
     BradfordWhiteWaveStatusCoordinator,
     BradfordWhiteWaveEnergyCoordinator,
@@ -24,14 +36,59 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.WATER_HEATER]
 class BradfordWhiteWaveData:
     """Data for the Bradford White Wave integration."""
 
-    client: BradfordWhiteClient
+    client: BradfordWhiteClient | RecordingClient | ReplayClient
     status_coordinator: BradfordWhiteWaveStatusCoordinator
     energy_coordinator: BradfordWhiteWaveEnergyCoordinator
+    options: dict[str, Any]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Bradford White Wave from a config entry."""
 
+    cassette_mode = entry.options.get(CONF_CASSETTE_MODE, CASSETTE_MODE_OFF)
+    cassette_path = hass.config.path(
+        entry.options.get(CONF_CASSETTE_PATH, DEFAULT_CASSETTE_PATH)
+    )
+    speed = 1.0
+
+    if cassette_mode == CASSETTE_MODE_REPLAY:
+        # Replay never talks to the cloud, so skip authentication entirely
+        _LOGGER.warning(
+            "Replaying recorded API traffic, energy sensors are excluded from "
+            "long-term statistics until replay is turned off"
+        )
+        speed = entry.options.get(CONF_REPLAY_SPEED, DEFAULT_REPLAY_SPEED)
+        client = await ReplayClient.async_load(hass, cassette_path, speed)
+    else:
+        client = await _async_authenticate(hass, entry)
+        if cassette_mode == CASSETTE_MODE_RECORD:
+            client = RecordingClient(hass, client, cassette_path)
+
+    status_coordinator = BradfordWhiteWaveStatusCoordinator(
+        hass, client, entry, speed
+    )
+    energy_coordinator = BradfordWhiteWaveEnergyCoordinator(
+        hass, client, entry, speed
+    )
+
+    await status_coordinator.async_config_entry_first_refresh()
+    await energy_coordinator.async_config_entry_first_refresh()
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = BradfordWhiteWaveData(
+        client, status_coordinator, energy_coordinator, dict(entry.options)
+    )
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    return True
+
+
+async def _async_authenticate(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> BradfordWhiteClient:
+    """Create and authenticate the API client."""
     refresh_token = entry.data["refresh_token"]
 
     client = BradfordWhiteClient(refresh_token)
@@ -49,19 +106,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Failed to authenticate with Bradford White Wave: %s", ex)
         raise
 
-    status_coordinator = BradfordWhiteWaveStatusCoordinator(hass, client, entry)
-    energy_coordinator = BradfordWhiteWaveEnergyCoordinator(hass, client, entry)
-
-    await status_coordinator.async_config_entry_first_refresh()
-    await energy_coordinator.async_config_entry_first_refresh()
-
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = BradfordWhiteWaveData(
-        client, status_coordinator, energy_coordinator
-    )
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    return True
+    return client
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -71,3 +116,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await data.client.close()
 
     return unload_ok
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    # Token updates also land here, those must not trigger a reload
+    data: BradfordWhiteWaveData = hass.data[DOMAIN][entry.entry_id]
+    if data.options == dict(entry.options):
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
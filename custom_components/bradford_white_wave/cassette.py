@@ -0,0 +1,285 @@
+"""Record and replay Bradford White Wave API traffic.
+
+A cassette is a JSON lines file with one entry per client call. Each entry
+holds the method name, its arguments, the recording session it belongs to,
+when the call started relative to the start of that session, how long it
+took and either the result or the error it raised. Tokens are redacted
+before anything is written to disk.
+
+Every setup of the integration in record mode starts a new session in the
+same file. Replay uses the most recent session only, since offsets from
+different sessions do not share a timeline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from enum import Enum
+import json
+import logging
+import os
+import time
+from typing import Any
+
+from bradford_white_wave_client import BradfordWhiteClient
+from bradford_white_wave_client import exceptions, models
+from bradford_white_wave_client.exceptions import BradfordWhiteConnectError
+from pydantic import BaseModel
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Client methods used by the coordinators and the water heater entity
+READ_METHODS = ["list_devices", "get_status", "get_energy_usage"]
+COMMAND_METHODS = ["set_temperature", "set_mode"]
+RECORDED_METHODS = READ_METHODS + COMMAND_METHODS
+
+REDACTED = "**REDACTED**"
+
+
+def _encode(value: Any) -> Any:
+    """Convert a client argument or result into JSON-friendly data."""
+    if isinstance(value, BaseModel):
+        return {
+            "__model__": type(value).__name__,
+            "data": value.model_dump(mode="json", by_alias=True),
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Rebuild client models from recorded data."""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if isinstance(value, dict):
+        if "__model__" in value:
+            model = getattr(models, value["__model__"])
+            return model.model_validate(value["data"])
+        return {key: _decode(item) for key, item in value.items()}
+    return value
+
+
+def _redact(value: Any, secrets: list[str]) -> Any:
+    """Strip tokens from recorded data."""
+    if isinstance(value, str):
+        for secret in secrets:
+            value = value.replace(secret, REDACTED)
+        return value
+    if isinstance(value, list):
+        return [_redact(item, secrets) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if "token" in key.lower() else _redact(item, secrets)
+            for key, item in value.items()
+        }
+    return value
+
+
+def _call_key(method: str, args: list[Any]) -> str:
+    """Return the key used to match a replayed call to a recorded one."""
+    return json.dumps([method, args], sort_keys=True)
+
+
+class RecordingClient:
+    """Wrap a BradfordWhiteClient and record every call to a cassette."""
+
+    def __init__(
+        self, hass: HomeAssistant, client: BradfordWhiteClient, path: str
+    ) -> None:
+        """Initialize the recorder."""
+        self.hass = hass
+        self.client = client
+        self.path = path
+        self._session = round(time.time(), 3)
+        self._start = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._write_failed = False
+        _LOGGER.info("Recording Bradford White Wave API traffic to %s", path)
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass everything else, such as the refresh token, to the client."""
+        attr = getattr(self.client, name)
+        if name in RECORDED_METHODS:
+            return self._wrap(name, attr)
+        return attr
+
+    def _wrap(self, method: str, func: Any) -> Any:
+        """Wrap a client method so its calls are recorded."""
+
+        async def _recorded(*args: Any) -> Any:
+            started = time.monotonic()
+            entry: dict[str, Any] = {
+                "method": method,
+                "args": _encode(list(args)),
+                "session": self._session,
+                "offset": round(started - self._start, 3),
+            }
+            try:
+                result = await func(*args)
+            except Exception as err:
+                entry["error"] = {"type": type(err).__name__, "message": str(err)}
+                raise
+            else:
+                entry["result"] = _encode(result)
+                return result
+            finally:
+                # A cancelled call has neither, and nothing worth replaying
+                if "result" in entry or "error" in entry:
+                    entry["duration"] = round(time.monotonic() - started, 3)
+                    await self._async_write(entry)
+
+        return _recorded
+
+    async def _async_write(self, entry: dict[str, Any]) -> None:
+        """Append an entry to the cassette.
+
+        Write errors are logged rather than raised, so a broken cassette never
+        replaces the result or error of the real call.
+        """
+        secrets = [
+            token
+            for token in (
+                getattr(self.client, "refresh_token", None),
+                getattr(self.client, "_access_token", None),
+            )
+            if token
+        ]
+        line = json.dumps(_redact(entry, secrets))
+        async with self._lock:
+            try:
+                await self.hass.async_add_executor_job(self._append, line)
+            except OSError as err:
+                if not self._write_failed:
+                    _LOGGER.error("Unable to write cassette %s: %s", self.path, err)
+                    self._write_failed = True
+            else:
+                self._write_failed = False
+
+    def _append(self, line: str) -> None:
+        """Write a line to the cassette file."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+class ReplayClient:
+    """Stand in for a BradfordWhiteClient by replaying a cassette.
+
+    Replay follows the timeline of the latest recorded session: each call
+    gets the latest recorded response for the same method and arguments that
+    was due at that point. Reads wait for their first response if none is due
+    yet. Commands such as set_temperature are only answered if the same
+    command was recorded by then, and fail right away otherwise.
+    """
+
+    # Never report a token, so the coordinators do not touch the config entry
+    refresh_token = None
+
+    def __init__(self, entries: list[dict[str, Any]], speed: float) -> None:
+        """Initialize the replayer.
+
+        A speed of 2 replays the timeline and call latencies twice as fast.
+        """
+        self.speed = speed
+        if entries:
+            session = max(entry["session"] for entry in entries)
+            entries = [entry for entry in entries if entry["session"] == session]
+        self._entries: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for entry in sorted(entries, key=lambda entry: entry["offset"]):
+            self._entries[_call_key(entry["method"], entry["args"])].append(entry)
+        self._end = max(
+            (entry["offset"] + entry.get("duration", 0) for entry in entries),
+            default=0,
+        )
+        self._served: set[int] = set()
+        self._start = time.monotonic()
+
+    @classmethod
+    async def async_load(
+        cls, hass: HomeAssistant, path: str, speed: float
+    ) -> ReplayClient:
+        """Load a cassette from disk."""
+        try:
+            entries = await hass.async_add_executor_job(cls._read, path)
+            client = cls(entries, speed)
+        except OSError as err:
+            raise ConfigEntryError(f"Unable to read cassette {path}: {err}") from err
+        except (ValueError, KeyError, TypeError) as err:
+            raise ConfigEntryError(f"Invalid cassette {path}: {err}") from err
+        _LOGGER.info(
+            "Replaying %d Bradford White Wave API calls from %s",
+            sum(len(recorded) for recorded in client._entries.values()),
+            path,
+        )
+        return client
+
+    @staticmethod
+    def _read(path: str) -> list[dict[str, Any]]:
+        """Read the cassette file."""
+        with open(path, encoding="utf-8") as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    def __getattr__(self, name: str) -> Any:
+        """Return a replaying stand-in for recorded client methods."""
+        if name not in RECORDED_METHODS:
+            raise AttributeError(name)
+
+        async def _replayed(*args: Any) -> Any:
+            return await self._replay(name, list(args))
+
+        return _replayed
+
+    async def _replay(self, method: str, args: list[Any]) -> Any:
+        """Return the recorded response for a call at this point in time."""
+        now = (time.monotonic() - self._start) * self.speed
+        recorded = self._entries.get(_call_key(method, _encode(args)))
+        if not recorded:
+            raise BradfordWhiteConnectError(
+                f"No recorded response for {method}{tuple(args)}"
+            )
+
+        due = [entry for entry in recorded if entry["offset"] <= now]
+        if not due and method in COMMAND_METHODS:
+            raise BradfordWhiteConnectError(
+                f"No recorded response for {method}{tuple(args)}"
+            )
+        entry = due[-1] if due else recorded[0]
+        # Past the end, only hand out responses that have not been seen yet
+        if now > self._end and id(entry) in self._served:
+            raise BradfordWhiteConnectError("Cassette finished")
+        self._served.add(id(entry))
+
+        await asyncio.sleep(
+            (max(entry["offset"] - now, 0) + entry.get("duration", 0)) / self.speed
+        )
+
+        if error := entry.get("error"):
+            raise _rebuild_error(error)
+        return _decode(entry.get("result"))
+
+    async def close(self) -> None:
+        """Nothing to close when replaying."""
+
+
+def _rebuild_error(error: dict[str, str]) -> BaseException:
+    """Recreate a recorded error, keeping library errors as their own type."""
+    message = error["message"]
+    if "401" in message or "Access denied" in message:
+        # Replayed auth failures must not start reauth of the live account
+        return BradfordWhiteConnectError(
+            f"Recorded authentication failure ({error['type']})"
+        )
+    error_cls = getattr(exceptions, error["type"], None)
+    if isinstance(error_cls, type) and issubclass(error_cls, Exception):
+        return error_cls(error["message"])
+    # Anything else was an unexpected error in the recording too
+    return Exception(f"{error['type']}: {error['message']}")
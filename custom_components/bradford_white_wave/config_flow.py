@@ -8,10 +8,20 @@ from typing import Any
 from bradford_white_wave_client import BradfordWhiteClient
 from bradford_white_wave_client.exceptions import BradfordWhiteConnectError, BradfordWhiteAuthError
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 import voluptuous as vol
 
-from .const import DOMAIN
+from .const import (
+    CASSETTE_MODE_OFF,
+    CASSETTE_MODES,
+    CONF_CASSETTE_MODE,
+    CONF_CASSETTE_PATH,
+    CONF_REPLAY_SPEED,
+    DEFAULT_CASSETTE_PATH,
+    DEFAULT_REPLAY_SPEED,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +36,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -69,3 +87,39 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "auth_url": auth_url
             }
         )
+
+
+class OptionsFlow(config_entries.OptionsFlow):
+    """Handle options for Bradford White Wave."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage recording and replaying of API traffic."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_CASSETTE_MODE,
+                        default=options.get(CONF_CASSETTE_MODE, CASSETTE_MODE_OFF),
+                    ): vol.In(CASSETTE_MODES),
+                    vol.Required(
+                        CONF_CASSETTE_PATH,
+                        default=options.get(CONF_CASSETTE_PATH, DEFAULT_CASSETTE_PATH),
+                    ): str,
+                    vol.Required(
+                        CONF_REPLAY_SPEED,
+                        default=options.get(CONF_REPLAY_SPEED, DEFAULT_REPLAY_SPEED),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                }
+            ),
+        )
@@ -8,6 +8,19 @@ REGULAR_INTERVAL = timedelta(seconds=60)
 FAST_INTERVAL = timedelta(seconds=10)
 ENERGY_USAGE_INTERVAL = timedelta(minutes=5)
 
+# Cassette (record/replay of API traffic)
+CONF_CASSETTE_MODE = "cassette_mode"
+CONF_CASSETTE_PATH = "cassette_path"
+CONF_REPLAY_SPEED = "replay_speed"
+
+CASSETTE_MODE_OFF = "off"
+CASSETTE_MODE_RECORD = "record"
+CASSETTE_MODE_REPLAY = "replay"
+CASSETTE_MODES = [CASSETTE_MODE_OFF, CASSETTE_MODE_RECORD, CASSETTE_MODE_REPLAY]
+
+DEFAULT_CASSETTE_PATH = "bradford_white_wave_cassette.jsonl"
+DEFAULT_REPLAY_SPEED = 1.0
+
 # Mode mappings
 from bradford_white_wave_client.models import BradfordWhiteMode
 from homeassistant.components.water_heater import (
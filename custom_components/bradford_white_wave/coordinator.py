@@ -1,8 +1,10 @@
 """The data update coordinator for the Bradford White Wave integration."""
 
+from __future__ import annotations
+
 import datetime
 import logging
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
 
 from bradford_white_wave_client import (
     BradfordWhiteClient,
@@ -22,6 +24,9 @@ from .const import (
     ENERGY_USAGE_INTERVAL,
 )
 
+if TYPE_CHECKING:
+    from .cassette import RecordingClient, ReplayClient
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -31,11 +36,23 @@ class BradfordWhiteWaveStatusCoordinator(
     """Coordinator for device status, updating with a frequent interval."""
 
     def __init__(
-        self, hass: HomeAssistant, client: BradfordWhiteClient, entry: ConfigEntry
+        self,
+        hass: HomeAssistant,
+        client: BradfordWhiteClient | RecordingClient | ReplayClient,
+        entry: ConfigEntry,
+        speed: float = 1.0,
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator.
+
+        A speed above 1 polls faster than normal, used when replaying a cassette.
+        """
+        self.regular_interval = REGULAR_INTERVAL / speed
+        self.fast_interval = FAST_INTERVAL / speed
         super().__init__(
-            hass, _LOGGER, name=f"{DOMAIN}_status", update_interval=REGULAR_INTERVAL
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_status",
+            update_interval=self.regular_interval,
         )
         self.client = client
         self.entry = entry
@@ -47,14 +64,14 @@ class BradfordWhiteWaveStatusCoordinator(
             # Check if we should use fast interval
             last_api_set = self.shared_data.get("last_api_set_datetime")
             if last_api_set:
-                if (datetime.datetime.now() - last_api_set) < REGULAR_INTERVAL:
-                    if self.update_interval != FAST_INTERVAL:
+                if (datetime.datetime.now() - last_api_set) < self.regular_interval:
+                    if self.update_interval != self.fast_interval:
                         _LOGGER.debug("Setting fast update interval")
-                        self.update_interval = FAST_INTERVAL
+                        self.update_interval = self.fast_interval
                 else:
-                    if self.update_interval != REGULAR_INTERVAL:
+                    if self.update_interval != self.regular_interval:
                         _LOGGER.debug("Setting regular update interval")
-                        self.update_interval = REGULAR_INTERVAL
+                        self.update_interval = self.regular_interval
                         self.shared_data["last_api_set_datetime"] = None
 
             devices = await self.client.list_devices()
@@ -98,15 +115,16 @@ class BradfordWhiteWaveEnergyCoordinator(
     def __init__(
         self,
         hass: HomeAssistant,
-        client: BradfordWhiteClient,
+        client: BradfordWhiteClient | RecordingClient | ReplayClient,
         entry: ConfigEntry,
+        speed: float = 1.0,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_energy",
-            update_interval=ENERGY_USAGE_INTERVAL,
+            update_interval=ENERGY_USAGE_INTERVAL / speed,
         )
         self.client = client
         self.entry = entry
@@ -14,7 +14,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 
-from .const import DOMAIN
+from .const import CASSETTE_MODE_REPLAY, CONF_CASSETTE_MODE, DOMAIN
 from .coordinator import BradfordWhiteWaveEnergyCoordinator
 from .entity import BradfordWhiteWaveEnergyEntity
 
@@ -31,6 +31,7 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: BradfordWhiteWaveEnergyCoordinator = data.energy_coordinator
     status_coordinator = data.status_coordinator
+    replaying = data.options.get(CONF_CASSETTE_MODE) == CASSETTE_MODE_REPLAY
 
     entities = []
 
@@ -55,6 +56,7 @@ async def async_setup_entry(
                         view_type,
                         energy_type,
                         device.friendly_name,
+                        replaying,
                     )
                 )
 
@@ -77,12 +79,17 @@ class BradfordWhiteWaveEnergySensor(BradfordWhiteWaveEnergyEntity, SensorEntity)
         view_type: str,
         energy_type: str,
         device_name: str,
+        replaying: bool = False,
     ) -> None:
         """Initialize."""
         super().__init__(coordinator, mac_address, info)
         self._view_type = view_type
         self._energy_type = energy_type
 
+        # Replayed totals must not reach long-term statistics
+        if replaying:
+            self._attr_state_class = None
+
         # Format name: "DeviceName Daily Total Energy"
         pretty_view = view_type.title()
         pretty_type = energy_type.replace("_", " ").title()
@@ -0,0 +1,274 @@
+"""Tests for recording and replaying Bradford White Wave API traffic."""
+
+import asyncio
+from datetime import datetime
+import json
+
+from bradford_white_wave_client.exceptions import (
+    BradfordWhiteAuthError,
+    BradfordWhiteConnectError,
+)
+from bradford_white_wave_client.models import (
+    BradfordWhiteMode,
+    DeviceStatus,
+    EnergyUsage,
+    WriteResponse,
+)
+import pytest
+
+from custom_components.bradford_white_wave.cassette import (
+    RecordingClient,
+    ReplayClient,
+    _decode,
+    _encode,
+    _rebuild_error,
+)
+from homeassistant.exceptions import ConfigEntryError
+
+MAC = "AA:BB:CC:DD:EE:FF"
+REFRESH_TOKEN = "refresh-secret"
+ACCESS_TOKEN = "access-secret"
+
+DEVICE = DeviceStatus(
+    macAddress=MAC,
+    friendlyName="Water Heater",
+    serialNumber="SN123",
+    setpointFahrenheit=120,
+    heatModeValue=3,
+    applianceType="HPWH",
+)
+USAGE = [
+    EnergyUsage(
+        timestamp=datetime(2026, 10, 1),
+        total_energy=12.5,
+        heat_pump_energy=10.0,
+        element_energy=2.5,
+    )
+]
+WRITE = WriteResponse(status="ok", requested_mode=5, actual_mode=5)
+
+
+class FakeHass:
+    """Just enough of HomeAssistant for the cassette."""
+
+    async def async_add_executor_job(self, target, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+
+class FakeClient:
+    """Client returning canned responses."""
+
+    refresh_token = REFRESH_TOKEN
+    _access_token = ACCESS_TOKEN
+
+    def __init__(self, total_energy: float = 12.5) -> None:
+        self.total_energy = total_energy
+
+    async def list_devices(self):
+        return [DEVICE]
+
+    async def get_status(self, mac_address):
+        return DEVICE
+
+    async def get_energy_usage(self, mac_address, view_type):
+        return [USAGE[0].model_copy(update={"total_energy": self.total_energy})]
+
+    async def set_mode(self, mac_address, mode):
+        return WRITE
+
+    async def set_temperature(self, mac_address, temperature):
+        raise BradfordWhiteConnectError(
+            f"401 Access denied for {REFRESH_TOKEN} / {ACCESS_TOKEN}"
+        )
+
+
+def _entry(method, args, offset, result, session=1.0):
+    return {
+        "method": method,
+        "args": args,
+        "session": session,
+        "offset": offset,
+        "duration": 0,
+        "result": _encode(result),
+    }
+
+
+def _energy(total_energy: float) -> list[EnergyUsage]:
+    return [USAGE[0].model_copy(update={"total_energy": total_energy})]
+
+
+@pytest.mark.parametrize("value", [[DEVICE], DEVICE, USAGE, WRITE])
+def test_models_round_trip(value) -> None:
+    """Recorded models validate back into equal objects."""
+    assert _decode(json.loads(json.dumps(_encode(value)))) == value
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay(tmp_path) -> None:
+    """Every recorded call replays with the same result or error."""
+    path = str(tmp_path / "cassette.jsonl")
+    recorder = RecordingClient(FakeHass(), FakeClient(), path)
+
+    assert recorder.refresh_token == REFRESH_TOKEN
+    await recorder.list_devices()
+    await recorder.get_status(MAC)
+    await recorder.get_energy_usage(MAC, "weekly")
+    await recorder.set_mode(MAC, BradfordWhiteMode.VACATION)
+    with pytest.raises(BradfordWhiteConnectError):
+        await recorder.set_temperature(MAC, 120)
+
+    replay = await ReplayClient.async_load(FakeHass(), path, 100)
+
+    assert replay.refresh_token is None
+    assert await replay.list_devices() == [DEVICE]
+    assert await replay.get_status(MAC) == DEVICE
+    assert await replay.get_energy_usage(MAC, "weekly") == USAGE
+    assert await replay.set_mode(MAC, BradfordWhiteMode.VACATION) == WRITE
+
+
+@pytest.mark.asyncio
+async def test_tokens_are_redacted(tmp_path) -> None:
+    """Neither token ends up in the cassette."""
+    path = tmp_path / "cassette.jsonl"
+    recorder = RecordingClient(FakeHass(), FakeClient(), str(path))
+    with pytest.raises(BradfordWhiteConnectError):
+        await recorder.set_temperature(MAC, 120)
+
+    content = path.read_text()
+    assert REFRESH_TOKEN not in content
+    assert ACCESS_TOKEN not in content
+    assert "**REDACTED**" in content
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_is_not_recorded(tmp_path) -> None:
+    """A cancelled call leaves nothing to replay."""
+
+    class SlowClient(FakeClient):
+        async def get_status(self, mac_address):
+            await asyncio.sleep(10)
+
+    path = tmp_path / "cassette.jsonl"
+    recorder = RecordingClient(FakeHass(), SlowClient(), str(path))
+    task = asyncio.ensure_future(recorder.get_status(MAC))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert not path.exists()
+
+
+@pytest.mark.asyncio
+async def test_write_error_keeps_real_result(tmp_path, caplog) -> None:
+    """A cassette that cannot be written does not break the real call."""
+    (tmp_path / "blocker").write_text("")
+    path = str(tmp_path / "blocker" / "cassette.jsonl")
+    recorder = RecordingClient(FakeHass(), FakeClient(), path)
+
+    assert await recorder.list_devices() == [DEVICE]
+    assert await recorder.get_status(MAC) == DEVICE
+    assert caplog.text.count("Unable to write cassette") == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_directory_is_created(tmp_path) -> None:
+    """The cassette directory is created on the first write."""
+    path = tmp_path / "cassettes" / "cassette.jsonl"
+    recorder = RecordingClient(FakeHass(), FakeClient(), str(path))
+    await recorder.list_devices()
+
+    assert path.exists()
+
+
+@pytest.mark.asyncio
+async def test_replay_uses_latest_session(tmp_path) -> None:
+    """Offsets of an older session in the same file are ignored."""
+    path = str(tmp_path / "cassette.jsonl")
+    first = RecordingClient(FakeHass(), FakeClient(10.0), path)
+    first._session -= 60
+    await first.get_energy_usage(MAC, "weekly")
+    first._start -= 0.3
+    await first.get_energy_usage(MAC, "weekly")
+    second = RecordingClient(FakeHass(), FakeClient(99.0), path)
+    await second.get_energy_usage(MAC, "weekly")
+
+    replay = await ReplayClient.async_load(FakeHass(), path, 1)
+    usage = await replay.get_energy_usage(MAC, "weekly")
+    assert usage[0].total_energy == 99.0
+    await asyncio.sleep(0.35)
+    with pytest.raises(BradfordWhiteConnectError, match="finished"):
+        await replay.get_energy_usage(MAC, "weekly")
+
+
+@pytest.mark.asyncio
+async def test_replay_follows_timeline() -> None:
+    """Each call gets the latest response due, waiting for the first one."""
+    replay = ReplayClient(
+        [
+            _entry("get_energy_usage", [MAC, "weekly"], 0.2, _energy(10.0)),
+            _entry("get_energy_usage", [MAC, "weekly"], 0.4, _energy(11.0)),
+        ],
+        1,
+    )
+
+    assert (await replay.get_energy_usage(MAC, "weekly"))[0].total_energy == 10.0
+    await asyncio.sleep(0.25)
+    assert (await replay.get_energy_usage(MAC, "weekly"))[0].total_energy == 11.0
+
+    await asyncio.sleep(0.1)
+    with pytest.raises(BradfordWhiteConnectError, match="finished"):
+        await replay.get_energy_usage(MAC, "weekly")
+
+
+@pytest.mark.asyncio
+async def test_command_before_recording_fails_immediately() -> None:
+    """Commands never wait for a response recorded later."""
+    replay = ReplayClient([_entry("set_mode", [MAC, 5], 3600, WRITE)], 1)
+
+    with pytest.raises(BradfordWhiteConnectError, match="No recorded response"):
+        await asyncio.wait_for(replay.set_mode(MAC, BradfordWhiteMode.VACATION), 1)
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_call_fails() -> None:
+    """A call that was never recorded fails like a connection error."""
+    replay = ReplayClient([_entry("get_status", [MAC], 0, DEVICE)], 1)
+
+    with pytest.raises(BradfordWhiteConnectError, match="No recorded response"):
+        await replay.get_status("00:00:00:00:00:00")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", [None, "{not json\n", '{"method": "x"}\n'])
+async def test_invalid_cassette(tmp_path, content) -> None:
+    """A missing or malformed cassette fails setup with a clear error."""
+    path = tmp_path / "cassette.jsonl"
+    if content is not None:
+        path.write_text(content)
+
+    with pytest.raises(ConfigEntryError, match="cassette"):
+        await ReplayClient.async_load(FakeHass(), str(path), 1)
+
+
+def test_rebuild_error() -> None:
+    """Library errors keep their type, others keep their name."""
+    error = _rebuild_error({"type": "BradfordWhiteAuthError", "message": "nope"})
+    assert isinstance(error, BradfordWhiteAuthError)
+
+    error = _rebuild_error({"type": "ClientError", "message": "boom"})
+    assert type(error) is Exception
+    assert str(error) == "ClientError: boom"
+
+    error = _rebuild_error({"type": "models", "message": "boom"})
+    assert type(error) is Exception
+
+
+def test_rebuild_auth_failure_is_not_an_auth_failure() -> None:
+    """Replayed 401s do not look like auth failures to the coordinators."""
+    error = _rebuild_error(
+        {"type": "BradfordWhiteConnectError", "message": "401 Access denied"}
+    )
+    assert isinstance(error, BradfordWhiteConnectError)
+    assert "401" not in str(error)
+    assert "Access denied" not in str(error)